@@ -1,67 +1,98 @@
-import json
-import sys
-from jsonschema import validate, ValidationError
-from datetime import datetime
+from typing import ClassVar
+
+# Box pieces shared by every report
+_HLINE_68 = "═" * 68
+_HLINE_70 = "─" * 70
+_BOX_RULE = "─" * 68
+_EMPTY_BOX_LINE = "│" + " " * 68 + "│"
+
+
 # NEW: Report generator
 class ValidationReport:
     """Creates nice-looking validation reports."""
     
+    # Fixed parts of the report, assembled once for every instance
+    _HEADER: ClassVar[str] = "\n".join([
+        "",
+        "╔" + _HLINE_68 + "╗",
+        "║" + " " * 68 + "║",
+        "║" + "  API TEST CONFIGURATION VALIDATION REPORT".center(68) + "║",
+        "║" + " " * 68 + "║",
+        "╚" + _HLINE_68 + "╝",
+        "",
+    ])
+    
+    _PASS_BOX: ClassVar[str] = "\n".join([
+        "┌" + _BOX_RULE + "┐",
+        "│  " + "✓ VALIDATION PASSED".ljust(66) + "│",
+        _EMPTY_BOX_LINE,
+        "│  " + "Your configuration is valid and ready to use!".ljust(66) + "│",
+        "└" + _BOX_RULE + "┘",
+    ])
+    
+    # Only the error count changes, so its line is padded when formatted
+    _FAIL_BOX_TEMPLATE: ClassVar[str] = "\n".join([
+        "┌" + _BOX_RULE + "┐",
+        "│  " + "✗ VALIDATION FAILED".ljust(66) + "│",
+        _EMPTY_BOX_LINE,
+        "│  {message:<66}│",
+        "└" + _BOX_RULE + "┘",
+    ])
+    
     def __init__(self, config_path):
+        from datetime import datetime  # deferred to keep CLI startup cheap
+        
         self.config_path = config_path
         self.schema_errors = []
         self.custom_errors = []
         self.is_valid = False
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    def generate(self):
-        """Generate a formatted report."""
-        lines = []
-        
-        # Header
-        lines.append("")
-        lines.append("╔" + "═" * 68 + "╗")
-        lines.append("║" + " " * 68 + "║")
-        lines.append("║" + "  API TEST CONFIGURATION VALIDATION REPORT".center(68) + "║")
-        lines.append("║" + " " * 68 + "║")
-        lines.append("╚" + "═" * 68 + "╝")
-        lines.append("")
-        
-        # File info
-        lines.append(f"Configuration File: {self.config_path}")
-        lines.append(f"Validation Time:    {self.timestamp}")
-        lines.append("")
+    def _lines(self):
+        """Yield the report one line (or pre-built block) at a time."""
+        # Header and file info
+        yield self._HEADER
+        yield f"Configuration File: {self.config_path}"
+        yield f"Validation Time:    {self.timestamp}"
+        yield ""
         
         # Overall result
         if self.is_valid:
-            lines.append("┌" + "─" * 68 + "┐")
-            lines.append("│  " + "✓ VALIDATION PASSED".ljust(66) + "│")
-            lines.append("│" + " " * 68 + "│")
-            lines.append("│  " + "Your configuration is valid and ready to use!".ljust(66) + "│")
-            lines.append("└" + "─" * 68 + "┘")
+            yield self._PASS_BOX
         else:
             total_errors = len(self.schema_errors) + len(self.custom_errors)
-            lines.append("┌" + "─" * 68 + "┐")
-            lines.append("│  " + "✗ VALIDATION FAILED".ljust(66) + "│")
-            lines.append("│" + " " * 68 + "│")
-            lines.append("│  " + f"Found {total_errors} error(s) that need to be fixed".ljust(66) + "│")
-            lines.append("└" + "─" * 68 + "┘")
-            lines.append("")
+            yield self._FAIL_BOX_TEMPLATE.format(
+                message=f"Found {total_errors} error(s) that need to be fixed"
+            )
+            yield ""
             
-            # Schema errors
-            if self.schema_errors:
-                lines.append("Schema Validation Errors:")
-                lines.append("─" * 70)
-                for i, error in enumerate(self.schema_errors, 1):
-                    lines.append(f"{i}. {error}")
-                lines.append("")
-            
-            # Custom errors
-            if self.custom_errors:
-                lines.append("Business Logic Errors:")
-                lines.append("─" * 70)
-                for i, error in enumerate(self.custom_errors, 1):
-                    lines.append(f"{i}. {error}")
-                lines.append("")
+            # Schema errors, then custom errors
+            sections = (
+                ("Schema Validation Errors:", self.schema_errors),
+                ("Business Logic Errors:", self.custom_errors),
+            )
+            for title, errors in sections:
+                if errors:
+                    yield title
+                    yield _HLINE_70
+                    for i, error in enumerate(errors, 1):
+                        yield f"{i}. {error}"
+                    yield ""
+        
+        yield ""
+    
+    def write(self, out):
+        """
+        Write the report to a text stream as it is produced.
+        
+        The output matches print(report.generate()).
         
-        lines.append("")
-        return "\n".join(lines)
\ No newline at end of file
+        Args:
+            out: Any object with a write() method, e.g. sys.stdout
+        """
+        for line in self._lines():
+            out.write(line + "\n")
+    
+    def generate(self):
+        """Generate a formatted report."""
+        return "\n".join(self._lines())
@@ -1,11 +1,12 @@
 from config import Config
-import yaml 
 
 class APIParser:
     def __init__(self):
         pass
 
     def load_config(self, config_file_path: str):
+        import yaml  # deferred so importing the parser stays cheap
+        
         with open(config_file_path, 'r') as file:
             config_data = yaml.safe_load(file)
             self.config = Config(**config_data["config"])  # unpacking dictionary to dataclass
@@ -1,28 +1,44 @@
 import json
 import sys
-from jsonschema import validate, ValidationError
-from datetime import datetime
 import core.api_parser.test_gen_schema_verifier_helper as helper
-import ValidationReport as vr
+import core.api_parser.ValidationReport as vr
 
 # NEW: Main validator class
 class ConfigValidator:
     """Main validator that ties everything together."""
     
-    def __init__(self, schema_path):
+    def __init__(self, schema_path, use_generated_validator=False):
         """
         Initialize validator with a schema.
         
         Args:
             schema_path: Path to the JSON schema file
+            use_generated_validator: If True, use a module written by
+                emit_fast_validator() when one on the import path matches
+                the schema
         """
         self.schema_path = schema_path
+        self.use_generated_validator = use_generated_validator
         self.schema = None
+        self._validator = None
+        self._compiled = None
     
     def load_schema(self):
         """Load the schema file."""
         try:
             self.schema = helper.load_json_file(self.schema_path)
+            
+            # A matching emitted module replaces the fastjsonschema compile;
+            # the Draft7Validator is still needed to report errors
+            generated = None
+            if self.use_generated_validator:
+                generated = helper.load_generated_validator(self.schema)
+            
+            self._validator, self._compiled = helper.get_validator(
+                self.schema, compile_fast=generated is None
+            )
+            if generated is not None:
+                self._compiled = generated
             return True
         except Exception as e:
             print(f"Error loading schema: {e}")
@@ -62,7 +78,9 @@ class ConfigValidator:
         if verbose:
             print("\nValidating against schema...")
         
-        is_valid, schema_errors = helper.validate_against_schema(config, self.schema)
+        is_valid, schema_errors = helper.validate_against_schema(
+            config, self._validator, compiled=self._compiled
+        )
         report.schema_errors = schema_errors
         
         if verbose:
@@ -88,7 +106,7 @@ class ConfigValidator:
         report.is_valid = is_valid and not custom_errors
         
         # Print report
-        print(report.generate())
+        report.write(sys.stdout)
         
         return report.is_valid
 
@@ -98,21 +116,45 @@ def main():
     """Command-line interface for the validator."""
     
     # Parse command-line arguments
-    if len(sys.argv) < 3:
-        print("Usage: python validator.py <config_file> <schema_file> [--quiet]")
+    args = sys.argv[1:]
+    emit_path = None
+    
+    if "--emit-validator" in args:
+        flag_index = args.index("--emit-validator")
+        if flag_index + 1 < len(args):
+            emit_path = args[flag_index + 1]
+        del args[flag_index:flag_index + 2]
+    
+    positional = [arg for arg in args if not arg.startswith("--")]
+    
+    if len(positional) < 2 or ("--emit-validator" in sys.argv and not emit_path):
+        print("Usage: python validator.py <config_file> <schema_file> [--quiet] [--emit-validator <out.py>]")
         print("")
         print("Examples:")
         print("  python validator.py test_config.json schema.json")
         print("  python validator.py test_config.json schema.json --quiet")
+        print("  python validator.py test_config.json schema.json --emit-validator generated_validator.py")
+        print("")
+        print(f"A validator emitted as {helper.GENERATED_VALIDATOR_MODULE}.py on the import path")
+        print("is used by later runs instead of compiling the schema again.")
         print("")
         sys.exit(1)
     
-    config_file = sys.argv[1]
-    schema_file = sys.argv[2]
-    quiet = "--quiet" in sys.argv
+    config_file = positional[0]
+    schema_file = positional[1]
+    quiet = "--quiet" in args
+    
+    # Write the precompiled validator, if asked
+    if emit_path:
+        try:
+            helper.emit_fast_validator(helper.load_json_file(schema_file), emit_path)
+            print(f"✓ Validator written to {emit_path}")
+        except Exception as e:
+            print(f"✗ Error writing validator: {e}")
+            sys.exit(1)
     
     # Validate
-    validator = ConfigValidator(schema_file)
+    validator = ConfigValidator(schema_file, use_generated_validator=True)
     is_valid = validator.validate_file(config_file, verbose=not quiet)
     
     # Exit with appropriate code
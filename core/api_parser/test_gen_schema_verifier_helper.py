@@ -1,115 +1,507 @@
+from dataclasses import dataclass, field
+import functools
+import hashlib
+import importlib
+from collections import Counter, deque, namedtuple
 import json
+import os
 import sys
-from jsonschema import validate, ValidationError
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, fall back to the stdlib parser
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional accelerator, jsonschema is always available
+    fastjsonschema = None
+
+# Module written by emit_fast_validator() and read by load_generated_validator()
+GENERATED_VALIDATOR_MODULE = "generated_validator"
+
+# Cache keys by schema object identity: {id(schema): (schema, _schema_key(schema))}
+# Holding the schema keeps its id from being reused while the entry exists
+_VALIDATOR_CACHE = {}
+_VALIDATOR_CACHE_SIZE = 128
+
+# Parsed JSON files: {absolute path: ((mtime_ns, size), data)}
+_JSON_CACHE = {}
+_JSON_CACHE_SIZE = 128
 
 
 def load_json_file(file_path):
-    """Load a JSON file and return its contents."""
-    with open(file_path, 'r') as file:
-        data = json.load(file)
+    """
+    Load a JSON file and return its contents.
+    
+    The last _JSON_CACHE_SIZE parsed files are cached and only re-read when
+    their modification time or size changes. The returned data is shared,
+    so treat it as read-only.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'rb') as file:
+            raw = file.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        _JSON_CACHE.pop(path, None)
+        if len(_JSON_CACHE) >= _JSON_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _JSON_CACHE[next(iter(_JSON_CACHE))]
+        cached = _JSON_CACHE[path] = (stamp, data)
+    
+    # Validation only reads the data, so the cached object is shared as-is
+    return cached[1]
+
+
+def build_validator(schema):
+    """
+    Check a schema once and build a reusable validator for it.
     
-    return data
+    Args:
+        schema: The JSON schema dictionary
+        
+    Returns:
+        A Draft7Validator bound to the schema
+    """
+    # Imported here so CLI runs only pay for jsonschema when they validate
+    from jsonschema import Draft7Validator
+    
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
 
 
-def validate_against_schema(data, schema):
-    """Check if data matches the schema rules."""
+def compile_fast_validator(schema):
+    """
+    Compile a schema with fastjsonschema, if it is installed.
+    
+    Args:
+        schema: The JSON schema dictionary
+        
+    Returns:
+        The compiled validation function, or None if fastjsonschema is
+        missing or cannot handle the schema
+    """
+    if fastjsonschema is None:
+        return None
+    
     try:
-        validate(instance=data, schema=schema)
+        # use_default=False: validation must never write defaults into the data
+        return fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def schema_fingerprint(schema):
+    """Return a stable hash of a schema's canonical JSON form."""
+    canonical = json.dumps(schema, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def emit_fast_validator(schema, out_path):
+    """
+    Write the schema's fastjsonschema validator to a Python module.
+    
+    Importing the module later skips compiling the schema at runtime.
+    
+    Args:
+        schema: The JSON schema dictionary
+        out_path: Where to write the generated module
+    """
+    if fastjsonschema is None:
+        raise RuntimeError("fastjsonschema is required to emit a validator")
+    
+    code = fastjsonschema.compile_to_code(schema, use_default=False)
+    with open(out_path, 'w') as file:
+        file.write(f'SCHEMA_FINGERPRINT = "{schema_fingerprint(schema)}"\n')
+        file.write(code)
+
+
+def load_generated_validator(schema, module_name=GENERATED_VALIDATOR_MODULE):
+    """
+    Import a module written by emit_fast_validator(), if it matches the schema.
+    
+    Args:
+        schema: The JSON schema dictionary
+        module_name: Name of the generated module on the import path
+        
+    Returns:
+        The module's validate function, or None if there is no generated
+        module or it was generated from a different schema
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    
+    if getattr(module, 'SCHEMA_FINGERPRINT', None) != schema_fingerprint(schema):
+        return None
+    return module.validate
+
+
+def _schema_key(schema):
+    """
+    Dump a schema to canonical JSON bytes for use as a cache key.
+    
+    orjson is much faster at this than json.dumps; the stdlib is used when
+    orjson is missing or cannot serialize the schema.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        except TypeError:  # orjson.JSONEncodeError, e.g. non-string keys
+            pass
+    return json.dumps(schema, sort_keys=True).encode('utf-8')
+
+
+@dataclass(eq=False, slots=True)
+class CachedSchema:
+    """
+    A schema with its cache key computed once.
+    
+    Pass it wherever a schema dictionary is accepted to skip the JSON dump
+    that get_validator() would otherwise do on a first-seen schema object.
+    """
+    schema: dict
+    key: bytes = field(init=False)
+    
+    def __post_init__(self):
+        self.key = _schema_key(self.schema)
+    
+    def __hash__(self):
+        return hash(self.key)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_schema_validator(schema_key):
+    """Build the Draft7Validator for a schema's _schema_key() dump."""
+    return build_validator(json.loads(schema_key))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_schema(schema_key, compile_fast=True):
+    """Get both validators for a schema's _schema_key() dump."""
+    compiled = compile_fast_validator(json.loads(schema_key)) if compile_fast else None
+    return _build_schema_validator(schema_key), compiled
+
+
+def get_validator(schema, compile_fast=True):
+    """
+    Get the validators for a schema, building them only the first time.
+    
+    Schemas are keyed by their canonical JSON form, so equal schemas loaded
+    separately (e.g. one ConfigValidator per validate_config call) share
+    the same validators. Passing the same schema object again skips even
+    the JSON dump, so schemas must not be modified after first use.
+    
+    Args:
+        schema: The JSON schema dictionary, or a CachedSchema
+        compile_fast: If False, skip the fastjsonschema compile, e.g. when
+            the caller already has a validator from load_generated_validator()
+        
+    Returns:
+        Tuple of (Draft7Validator, compiled fastjsonschema function or None)
+    """
+    if isinstance(schema, CachedSchema):
+        return _compile_schema(schema.key, compile_fast)
+    
+    entry = _VALIDATOR_CACHE.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return _compile_schema(entry[1], compile_fast)
+    
+    key = _schema_key(schema)
+    
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _VALIDATOR_CACHE[next(iter(_VALIDATOR_CACHE))]
+    _VALIDATOR_CACHE[id(schema)] = (schema, key)
+    
+    return _compile_schema(key, compile_fast)
+
+
+def format_schema_error(error):
+    """Turn a jsonschema ValidationError into a readable message."""
+    error_message = f"{error.message}"
+    if error.path:
+        path = " -> ".join(str(p) for p in error.path)
+        error_message = f"At '{path}': {error_message}"
+    return error_message
+
+
+def validate_against_schema(data, schema, compiled=None):
+    """
+    Check if data matches the schema rules.
+    
+    Args:
+        data: The data to validate
+        schema: A schema dictionary, a CachedSchema, or a validator from
+            build_validator()
+        compiled: Optional function from compile_fast_validator() used to
+            accept valid data without walking the schema in Python
+        
+    Returns:
+        Tuple of (is_valid, list of error messages)
+    """
+    if hasattr(schema, 'iter_errors'):
+        validator = schema
+    else:
+        validator, cached_compiled = get_validator(schema)
+        if compiled is None:
+            compiled = cached_compiled
+    
+    if compiled is not None:
+        try:
+            compiled(data)
+            return True, []
+        except fastjsonschema.JsonSchemaException:
+            # Fall through so every error is reported, not just the first
+            pass
+    
+    # Collect every error in one pass instead of stopping at the first,
+    # peeking first so valid data returns without building the error list
+    schema_errors = validator.iter_errors(data)
+    first_error = next(schema_errors, None)
+    if first_error is None:
         return True, []
-    except ValidationError as e:
-        error_message = f"{e.message}"
-        if e.path:
-            path = " -> ".join(str(p) for p in e.path)
-            error_message = f"At '{path}': {error_message}"
-        return False, [error_message]
+    
+    errors = [format_schema_error(first_error)]
+    errors.extend(format_schema_error(e) for e in schema_errors)
+    
+    return False, errors
 
 
-def check_unique_orders(config):
-    """Rule: Test order numbers must be unique."""
-    errors = []
-    all_tests = []
+def validate_many(instances, schema):
+    """
+    Check many pieces of data against the same schema.
+    
+    The validators are looked up once for the whole batch instead of once
+    per item, e.g. when checking a generated matrix of test cases.
+    
+    Args:
+        instances: Iterable of data to validate
+        schema: A schema dictionary, a CachedSchema, or a validator from
+            build_validator()
+        
+    Returns:
+        List of (is_valid, list of error messages), one per instance
+    """
+    if hasattr(schema, 'iter_errors'):
+        validator, compiled = schema, None
+    else:
+        validator, compiled = get_validator(schema)
+    
+    return [validate_against_schema(data, validator, compiled) for data in instances]
+
+
+def _iter_tests(config):
+    """Yield the top-level tests, then the tests of every suite."""
+    yield from config.get('tests', [])
+    
+    for suite in config.get('test_suites', []):
+        yield from suite.get('tests', [])
+
+
+def _intern_name(name):
+    """Intern a test name so repeated dict/set lookups compare by identity."""
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+# The tests as parallel columns (structure of arrays), read in one pass.
+# Position i in names, orders, depends_on and references is the same test.
+_TestTable = namedtuple('_TestTable', ['names', 'orders', 'depends_on', 'references', 'graph'])
+
+
+def _to_soa(config):
+    """
+    Read every test once into the columns shared by the checks.
     
-    if 'tests' in config:
-        all_tests = config['tests']
+    Args:
+        config: Your test configuration
+        
+    Returns:
+        _TestTable with:
+            names: Test name, or None if missing
+            orders: Test order number, or None if missing
+            depends_on: Tuple of depends_on test names
+            references: use_response_from test name, or None
+            graph: {test_name: (tests it depends on)}, with both kinds of
+                dependency; its keys are the names of all named tests
+        All test names are interned.
+    """
+    names = []
+    orders = []
+    depends_on = []
+    references = []
+    graph = {}
+    
+    for test in _iter_tests(config):
+        use_response_from = test.get('use_response_from')
+        referenced = use_response_from.get('test_name') if use_response_from else None
+        
+        test_name = _intern_name(test.get('name'))
+        dependencies = tuple(_intern_name(d) for d in test.get('depends_on', ()))
+        referenced = _intern_name(referenced) if referenced else None
+        
+        names.append(test_name)
+        orders.append(test.get('order'))
+        depends_on.append(dependencies)
+        references.append(referenced)
+        
+        if test_name:
+            graph[test_name] = dependencies + (referenced,) if referenced else dependencies
     
-    if 'test_suites' in config:
-        for suite in config['test_suites']:
-            if 'tests' in suite:
-                all_tests.extend(suite['tests'])
+    return _TestTable(names, orders, depends_on, references, graph)
+
+
+def check_unique_orders(config, table=None):
+    """Rule: Test order numbers must be unique."""
+    errors = []
     
-    orders = [t['order'] for t in all_tests if 'order' in t]
+    if table is None:
+        table = _to_soa(config)
     
-    seen = set()
-    duplicates = set()
-    for order in orders:
-        if order in seen:
-            duplicates.add(order)
-        seen.add(order)
+    # Count the whole column in C, then drop the tests that had no order
+    order_counts = Counter(table.orders)
+    order_counts.pop(None, None)
+    duplicates = sorted(order for order, count in order_counts.items() if count > 1)
     
     if duplicates:
-        errors.append(f"Duplicate test orders: {sorted(duplicates)}")
+        errors.append(f"Duplicate test orders: {duplicates}")
     
     return errors
 
 
-def check_test_dependencies(config):
+def check_test_dependencies(config, table=None):
     """Rule: Test dependencies must reference existing tests."""
     errors = []
-    all_tests = []
     
-    if 'tests' in config:
-        all_tests = config['tests']
+    if table is None:
+        table = _to_soa(config)
     
-    if 'test_suites' in config:
-        for suite in config['test_suites']:
-            if 'tests' in suite:
-                all_tests.extend(suite['tests'])
+    # Every named test is a key of the dependency graph
+    existing = table.graph
     
-    all_test_names = {t.get('name') for t in all_tests if 'name' in t}
-    
-    for test in all_tests:
-        test_name = test.get('name', 'unnamed test')
+    for test_name, depends_on, referenced in zip(table.names, table.depends_on, table.references):
+        if test_name is None:
+            test_name = 'unnamed test'
         
-        if 'depends_on' in test:
-            for dependency in test['depends_on']:
-                if dependency not in all_test_names:
-                    errors.append(f"Test '{test_name}' depends on non-existent '{dependency}'")
+        for dependency in depends_on:
+            if dependency not in existing:
+                errors.append(f"Test '{test_name}' depends on non-existent '{dependency}'")
         
-        if 'use_response_from' in test:
-            referenced = test['use_response_from'].get('test_name')
-            if referenced and referenced not in all_test_names:
-                errors.append(f"Test '{test_name}' references non-existent '{referenced}'")
+        if referenced and referenced not in existing:
+            errors.append(f"Test '{test_name}' references non-existent '{referenced}'")
     
     return errors
 
 
+# Auth type -> (block the auth config must contain, error if it is missing)
+_AUTH_REQUIREMENTS = {
+    'bearer': ('bearer', "Bearer auth missing 'bearer' configuration"),
+    'basic': ('basic', "Basic auth missing 'basic' configuration"),
+    'api_key': ('api_key', "API key auth missing 'api_key' configuration"),
+}
+
+
 def check_required_auth_fields(config):
     """Rule: Auth configuration must have required fields for its type."""
     errors = []
     
-    if 'global_auth' not in config:
+    # No auth, no type, or a type without required blocks: nothing to check.
+    # TypeError covers unhashable types such as a list, which match no entry.
+    try:
+        auth = config['global_auth']
+        required, message = _AUTH_REQUIREMENTS[auth['type']]
+    except (KeyError, TypeError):
         return errors
     
-    auth = config['global_auth']
-    auth_type = auth.get('type')
-    
-    if auth_type == 'bearer' and 'bearer' not in auth:
-        errors.append("Bearer auth missing 'bearer' configuration")
-    elif auth_type == 'basic' and 'basic' not in auth:
-        errors.append("Basic auth missing 'basic' configuration")
-    elif auth_type == 'api_key' and 'api_key' not in auth:
-        errors.append("API key auth missing 'api_key' configuration")
+    if required not in auth:
+        errors.append(message)
     
     return errors
 
 
-def check_circular_dependencies(config):
+def _has_cycle_topo(graph):
+    """
+    Check whether a dependency graph has any loop, using Kahn's algorithm.
+    
+    Repeatedly removes tests that no remaining test depends on. If every
+    test gets removed there is no loop. Dependencies on tests that do not
+    exist are ignored, they cannot be part of a loop.
+    
+    Args:
+        graph: {test_name: [tests it depends on]}
+        
+    Returns:
+        True if at least one loop exists, False otherwise
+    """
+    in_degree = dict.fromkeys(graph, 0)
+    for dependencies in graph.values():
+        for dependency in dependencies:
+            if dependency in in_degree:
+                in_degree[dependency] += 1
+    
+    ready = deque(node for node, degree in in_degree.items() if degree == 0)
+    processed = 0
+    
+    while ready:
+        node = ready.popleft()
+        processed += 1
+        for dependency in graph[node]:
+            if dependency in in_degree:
+                in_degree[dependency] -= 1
+                if in_degree[dependency] == 0:
+                    ready.append(dependency)
+    
+    return processed != len(graph)
+
+
+def _shortest_loop(graph, start, members):
+    """
+    Find the shortest chain of dependencies leading from a test back to itself.
+    
+    Args:
+        graph: {test_name: [tests it depends on]}
+        start: Test the loop must start and end at
+        members: Tests in the same strongly connected component as start
+        
+    Returns:
+        List of tests along the loop, beginning with start (without
+        repeating it at the end)
+    """
+    # Breadth-first search inside the component, remembering how we got
+    # to each test so the path back to start can be rebuilt
+    came_from = {start: None}
+    queue = deque([start])
+    
+    while queue:
+        node = queue.popleft()
+        for dependency in graph.get(node, ()):
+            if dependency == start:
+                loop = [node]
+                while came_from[loop[-1]] is not None:
+                    loop.append(came_from[loop[-1]])
+                loop.reverse()
+                return loop
+            if dependency in members and dependency not in came_from:
+                came_from[dependency] = node
+                queue.append(dependency)
+    
+    # Unreachable for a real component, which always loops back to start
+    return [start]
+
+
+def check_circular_dependencies(config, table=None):
     """
     Rule: Tests cannot have circular dependencies (loops).
     
     Args:
         config: Your test configuration
+        table: Optional result of _to_soa(), to avoid reading the tests again
         
     Returns:
         List of error messages describing any loops found
@@ -117,91 +509,76 @@ def check_circular_dependencies(config):
     errors = []
     
     # Step 1: Collect all tests and their dependencies
-    all_tests = []
-    
-    if 'tests' in config:
-        all_tests = config['tests']
-    
-    if 'test_suites' in config:
-        for suite in config['test_suites']:
-            if 'tests' in suite:
-                all_tests.extend(suite['tests'])
+    if table is None:
+        table = _to_soa(config)
     
     # Step 2: Build the dependency graph
     # Graph structure: {test_name: [list of tests it depends on]}
-    graph = {}
+    # Both depends_on and use_response_from count as dependencies
+    graph = table.graph
+    
+    # Valid configs are the common case: prove there is no loop cheaply first
+    if not _has_cycle_topo(graph):
+        return errors
     
-    for test in all_tests:
-        test_name = test.get('name')
-        if not test_name:
+    # Step 3: Group tests into strongly connected components (iterative Tarjan)
+    # A component with more than one test, or a test depending on itself, is a loop
+    index = {}       # Order in which each test was first reached
+    lowlink = {}     # Smallest index reachable from the test
+    stack = []       # Tests whose component is not finished yet
+    on_stack = set()
+    
+    for start in graph:
+        if start in index:
             continue
         
-        dependencies = []
-        
-        # Add depends_on dependencies
-        if 'depends_on' in test:
-            dependencies.extend(test['depends_on'])
-        
-        # Add use_response_from dependencies
-        if 'use_response_from' in test:
-            referenced = test['use_response_from'].get('test_name')
-            if referenced:
-                dependencies.append(referenced)
-        
-        graph[test_name] = dependencies
-    
-    # Step 3: Detect cycles using Depth-First Search (DFS)
-    def find_cycle(node, visited, path):
-        """
-        Use DFS to find cycles in the graph.
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
         
-        Args:
-            node: Current test we're checking
-            visited: Set of tests we've completely checked
-            path: Current path we're exploring (to detect cycles)
-            
-        Returns:
-            List representing the cycle if found, None otherwise
-        """
-        # If we've seen this node in our current path, we found a cycle!
-        if node in path:
-            # Return the cycle
-            cycle_start = path.index(node)
-            return path[cycle_start:] + [node]
-        
-        # If we've already fully explored this node, skip it
-        if node in visited:
-            return None
-        
-        # Add to current path
-        path.append(node)
-        
-        # Check all dependencies
-        if node in graph:
-            for dependency in graph[node]:
-                cycle = find_cycle(dependency, visited, path)
-                if cycle:
-                    return cycle
-        
-        # Remove from path (backtrack)
-        path.remove(node)
-        
-        # Mark as fully visited
-        visited.add(node)
+        # Each work entry is a test and an iterator over its remaining dependencies
+        work = [(start, iter(graph[start]))]
         
-        return None
-    
-    # Step 4: Check each test for cycles
-    visited = set()
-    
-    for test_name in graph:
-        if test_name not in visited:
-            cycle = find_cycle(test_name, visited, [])
+        while work:
+            node, dependencies = work[-1]
             
-            if cycle:
-                # Format the cycle nicely
-                cycle_str = " → ".join(cycle)
-                errors.append(f"Circular dependency detected: {cycle_str}")
+            for dependency in dependencies:
+                if dependency not in index:
+                    # First visit: go deeper, resume this test's dependencies later
+                    index[dependency] = lowlink[dependency] = len(index)
+                    stack.append(dependency)
+                    on_stack.add(dependency)
+                    work.append((dependency, iter(graph.get(dependency, ()))))
+                    break
+                if dependency in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dependency])
+            else:
+                # All dependencies checked, backtrack
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                
+                if lowlink[node] != index[node]:
+                    continue
+                
+                # node is the root of a component, collect its members
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                
+                if len(component) > 1 or node in graph.get(node, ()):
+                    # Start from the alphabetically first test so output is stable
+                    first = min(component, key=str)
+                    cycle = _shortest_loop(graph, first, set(component))
+                    
+                    # Format the cycle nicely
+                    cycle_str = " → ".join(cycle + [first])
+                    errors.append(f"Circular dependency detected: {cycle_str}")
     
     return errors
 
@@ -210,9 +587,12 @@ def run_custom_validations(config):
     """Run all custom validation checks."""
     all_errors = []
     
-    all_errors.extend(check_unique_orders(config))
-    all_errors.extend(check_test_dependencies(config))
+    # Read the tests once and share the columns between the checks
+    table = _to_soa(config)
+    
+    all_errors.extend(check_unique_orders(config, table))
+    all_errors.extend(check_test_dependencies(config, table))
     all_errors.extend(check_required_auth_fields(config))
-    all_errors.extend(check_circular_dependencies(config))
+    all_errors.extend(check_circular_dependencies(config, table))
     
     return all_errors
@@ -0,0 +1,31 @@
+import io
+import pytest
+from core.api_parser.ValidationReport import ValidationReport
+
+# -------------------
+# Tests
+# -------------------
+
+# ---- write ----
+@pytest.mark.negative
+def test_write_matches_generate_for_failed_report():
+    report = ValidationReport("config.json")
+    report.schema_errors = ["At 'tests -> 0': 'order' is a required property"]
+    report.custom_errors = ["Duplicate test orders: [1]", "Circular dependency detected: A → B → A"]
+    report.is_valid = False
+    out = io.StringIO()
+    report.write(out)
+    assert out.getvalue() == report.generate() + "\n"
+    assert "Found 3 error(s)" in out.getvalue()
+    assert "Schema Validation Errors:" in out.getvalue()
+    assert "Business Logic Errors:" in out.getvalue()
+
+@pytest.mark.positive
+def test_write_matches_generate_for_passed_report():
+    report = ValidationReport("config.json")
+    report.is_valid = True
+    out = io.StringIO()
+    report.write(out)
+    assert out.getvalue() == report.generate() + "\n"
+    assert "✓ VALIDATION PASSED" in out.getvalue()
+    assert "Errors:" not in out.getvalue()
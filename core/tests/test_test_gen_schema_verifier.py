@@ -0,0 +1,164 @@
+import pytest
+import json
+import sys
+from core.api_parser import test_gen_schema_verifier as verifier
+from core.api_parser import test_gen_schema_verifier_helper as helper
+
+# --- Sample files ---
+sample_schema = {
+    "type": "object",
+    "properties": {
+        "tests": {"type": "array"}
+    },
+    "required": ["tests"]
+}
+
+valid_config = {"tests": [{"name": "t1", "order": 1}, {"name": "t2", "order": 2}]}
+
+@pytest.fixture
+def schema_file(tmp_path):
+    file_path = tmp_path / "schema.json"
+    file_path.write_text(json.dumps(sample_schema))
+    return str(file_path)
+
+@pytest.fixture
+def valid_config_file(tmp_path):
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps(valid_config))
+    return str(file_path)
+
+# -------------------
+# Tests
+# -------------------
+
+# ---- ConfigValidator ----
+@pytest.mark.positive
+def test_config_validator_builds_validator_once(schema_file, valid_config_file, monkeypatch):
+    calls = []
+    get_validator = helper.get_validator
+    def spy(schema, *args, **kwargs):
+        calls.append(schema)
+        return get_validator(schema, *args, **kwargs)
+    monkeypatch.setattr(helper, "get_validator", spy)
+
+    validator = verifier.ConfigValidator(schema_file)
+    assert validator.validate_file(valid_config_file, verbose=False)
+    assert validator.validate_file(valid_config_file, verbose=False)
+    assert len(calls) == 1
+
+@pytest.mark.positive
+def test_config_validator_uses_emitted_module_without_compiling(tmp_path, valid_config_file, monkeypatch):
+    pytest.importorskip("fastjsonschema")
+    # A schema no other test uses, so nothing is cached for it yet
+    schema = dict(sample_schema, title=str(tmp_path))
+    schema_path = tmp_path / "emitted_schema.json"
+    schema_path.write_text(json.dumps(schema))
+    module_name = helper.GENERATED_VALIDATOR_MODULE
+    helper.emit_fast_validator(schema, tmp_path / f"{module_name}.py")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    calls = []
+    compile_schema = helper.fastjsonschema.compile
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return compile_schema(*args, **kwargs)
+    monkeypatch.setattr(helper.fastjsonschema, "compile", spy)
+
+    try:
+        validator = verifier.ConfigValidator(str(schema_path), use_generated_validator=True)
+        assert validator.validate_file(valid_config_file, verbose=False)
+        assert validator._compiled.__module__ == module_name
+        assert calls == []
+
+        # Without the opt-in the schema is compiled as usual
+        validator = verifier.ConfigValidator(str(schema_path))
+        assert validator.validate_file(valid_config_file, verbose=False)
+        assert len(calls) == 1
+    finally:
+        sys.modules.pop(module_name, None)
+
+@pytest.fixture
+def recorded_reports(monkeypatch):
+    reports = []
+    class RecordingReport(verifier.vr.ValidationReport):
+        def __init__(self, config_path):
+            super().__init__(config_path)
+            reports.append(self)
+    monkeypatch.setattr(verifier.vr, "ValidationReport", RecordingReport)
+    return reports
+
+@pytest.mark.positive
+def test_validate_file_prints_report(schema_file, valid_config_file, recorded_reports, capsys):
+    validator = verifier.ConfigValidator(schema_file)
+    assert validator.validate_file(valid_config_file, verbose=False) is True
+    assert capsys.readouterr().out == recorded_reports[0].generate() + "\n"
+
+@pytest.mark.negative
+def test_validate_file_prints_failed_report(tmp_path, schema_file, recorded_reports, capsys):
+    config_path = tmp_path / "bad_config.json"
+    config_path.write_text(json.dumps({"name": "no tests"}))
+    validator = verifier.ConfigValidator(schema_file)
+    assert validator.validate_file(str(config_path), verbose=False) is False
+    out = capsys.readouterr().out
+    assert out == recorded_reports[0].generate() + "\n"
+    assert "Schema Validation Errors:" in out
+
+# ---- main ----
+@pytest.mark.negative
+def test_main_emit_validator_without_path(schema_file, valid_config_file, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["validator.py", valid_config_file, schema_file, "--emit-validator"])
+    with pytest.raises(SystemExit) as exit_info:
+        verifier.main()
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith("Usage:")
+
+@pytest.mark.positive
+def test_main_emit_validator_before_positional_args(tmp_path, schema_file, valid_config_file, monkeypatch, capsys):
+    pytest.importorskip("fastjsonschema")
+    out_path = tmp_path / "emitted.py"
+    monkeypatch.setattr(sys, "argv", [
+        "validator.py", "--emit-validator", str(out_path), valid_config_file, schema_file, "--quiet",
+    ])
+    with pytest.raises(SystemExit) as exit_info:
+        verifier.main()
+    assert exit_info.value.code == 0
+    assert out_path.read_text().startswith(f'SCHEMA_FINGERPRINT = "{helper.schema_fingerprint(sample_schema)}"')
+    assert f"✓ Validator written to {out_path}" in capsys.readouterr().out
+
+@pytest.mark.positive
+def test_main_validates_with_the_validator_it_emitted(tmp_path, valid_config_file, monkeypatch, capsys):
+    pytest.importorskip("fastjsonschema")
+    # A schema no other test uses, so nothing is cached for it yet
+    schema = dict(sample_schema, title=str(tmp_path))
+    schema_path = tmp_path / "emitted_schema.json"
+    schema_path.write_text(json.dumps(schema))
+    module_name = helper.GENERATED_VALIDATOR_MODULE
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    calls = []
+    monkeypatch.setattr(helper.fastjsonschema, "compile", lambda *args, **kwargs: calls.append(args))
+    monkeypatch.setattr(sys, "argv", [
+        "validator.py", valid_config_file, str(schema_path), "--quiet",
+        "--emit-validator", str(tmp_path / f"{module_name}.py"),
+    ])
+    try:
+        with pytest.raises(SystemExit) as exit_info:
+            verifier.main()
+    finally:
+        sys.modules.pop(module_name, None)
+    assert exit_info.value.code == 0
+    assert calls == []
+    out = capsys.readouterr().out
+    assert out.index("✓ Validator written") < out.index("VALIDATION PASSED")
+
+@pytest.mark.negative
+def test_main_invalid_config_exits_with_failure(tmp_path, schema_file, monkeypatch, capsys):
+    config_path = tmp_path / "bad_config.json"
+    config_path.write_text(json.dumps({"tests": [{"name": "t1", "order": 1}, {"name": "t2", "order": 1}]}))
+    monkeypatch.setattr(sys, "argv", ["validator.py", str(config_path), schema_file, "--quiet"])
+    with pytest.raises(SystemExit) as exit_info:
+        verifier.main()
+    assert exit_info.value.code == 1
+    assert "Duplicate test orders: [1]" in capsys.readouterr().out
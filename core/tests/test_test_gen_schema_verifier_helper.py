@@ -1,46 +1,63 @@
 import pytest
 import json
-from jsonschema import ValidationError
+import sys
+from types import MappingProxyType
 from core.api_parser import test_gen_schema_verifier_helper as helper
 
 # --- Sample JSON Configs ---
+# Configs are module-scoped fixtures, built once and shared by the tests
+# in this module. The mappingproxy only blocks writes to the top level, so
+# tests must not change the nested tests either.
 
 # Positive configs
-minimal_config = {
-    "tests": [{"name": "test1", "order": 1}]
-}
+@pytest.fixture(scope="module")
+def minimal_config():
+    return MappingProxyType({
+        "tests": [{"name": "test1", "order": 1}]
+    })
 
-valid_auth_config = {"global_auth": {"type": "bearer", "bearer": {"token": "abc"}}}
+@pytest.fixture(scope="module")
+def valid_auth_config():
+    return MappingProxyType({"global_auth": {"type": "bearer", "bearer": {"token": "abc"}}})
 
 valid_schema_data = {"name": "test1", "order": 1}
 
 # Negative configs
-duplicate_order_config = {
-    "tests": [{"name": "t1", "order": 1}, {"name": "t2", "order": 1}]
-}
+@pytest.fixture(scope="module")
+def duplicate_order_config():
+    return MappingProxyType({
+        "tests": [{"name": "t1", "order": 1}, {"name": "t2", "order": 1}]
+    })
 
-dependency_config = {
-    "tests": [
-        {"name": "t1", "order": 1},
-        {"name": "t2", "order": 2, "depends_on": ["nonexistent"]}
-    ]
-}
+@pytest.fixture(scope="module")
+def dependency_config():
+    return MappingProxyType({
+        "tests": [
+            {"name": "t1", "order": 1},
+            {"name": "t2", "order": 2, "depends_on": ["nonexistent"]}
+        ]
+    })
 
-circular_config = {
-    "tests": [
-        {"name": "A", "depends_on": ["B"]},
-        {"name": "B", "depends_on": ["C"]},
-        {"name": "C", "depends_on": ["A"]}
-    ]
-}
+@pytest.fixture(scope="module")
+def circular_config():
+    return MappingProxyType({
+        "tests": [
+            {"name": "A", "depends_on": ["B"]},
+            {"name": "B", "depends_on": ["C"]},
+            {"name": "C", "depends_on": ["A"]}
+        ]
+    })
 
 invalid_schema_data = {"name": "test2"}  # missing 'order'
 
-invalid_auth_configs = {
-    "bearer_missing": {"global_auth": {"type": "bearer"}},
-    "basic_missing": {"global_auth": {"type": "basic"}},
-    "api_key_missing": {"global_auth": {"type": "api_key"}},
-}
+@pytest.fixture(scope="module", params=[
+    ("bearer", "Bearer auth missing"),
+    ("basic", "Basic auth missing"),
+    ("api_key", "API key auth missing"),
+], ids=["bearer_missing", "basic_missing", "api_key_missing"])
+def invalid_auth_config(request):
+    auth_type, expected_error = request.param
+    return MappingProxyType({"global_auth": {"type": auth_type}}), expected_error
 
 # --- Schema ---
 sample_schema = {
@@ -52,6 +69,13 @@ sample_schema = {
     "required": ["name", "order"]
 }
 
+# Array of sample_schema items, reached through a $ref
+ref_schema = {
+    "definitions": {"test": sample_schema},
+    "type": "array",
+    "items": {"$ref": "#/definitions/test"},
+}
+
 # -------------------
 # Tests
 # -------------------
@@ -65,6 +89,33 @@ def test_load_json_file(tmp_path):
     loaded_data = helper.load_json_file(file_path)
     assert loaded_data == data_to_write
 
+@pytest.mark.positive
+def test_load_json_file_reloads_changed_file(tmp_path):
+    file_path = tmp_path / "temp.json"
+    file_path.write_text(json.dumps({"foo": "bar"}))
+    assert helper.load_json_file(file_path) == {"foo": "bar"}
+    file_path.write_text(json.dumps({"foo": "bar", "baz": 1}))
+    assert helper.load_json_file(file_path) == {"foo": "bar", "baz": 1}
+
+@pytest.mark.positive
+def test_load_json_file_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(helper, "_JSON_CACHE", {})
+    monkeypatch.setattr(helper, "_JSON_CACHE_SIZE", 2)
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"temp{i}.json"
+        file_path.write_text(json.dumps({"i": i}))
+        assert helper.load_json_file(file_path) == {"i": i}
+        paths.append(str(file_path))
+    assert list(helper._JSON_CACHE) == paths[1:]
+
+@pytest.mark.positive
+def test_load_json_file_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(helper, "orjson", None)
+    file_path = tmp_path / "temp.json"
+    file_path.write_text(json.dumps({"name": "tëst"}), encoding="utf-8")
+    assert helper.load_json_file(file_path) == {"name": "tëst"}
+
 # ---- validate_against_schema ----
 @pytest.mark.positive
 def test_validate_against_schema_valid():
@@ -79,49 +130,220 @@ def test_validate_against_schema_invalid():
     assert len(errors) == 1
     assert "order" in errors[0]
 
+@pytest.mark.negative
+def test_validate_against_schema_reports_all_errors():
+    is_valid, errors = helper.validate_against_schema({"name": 5}, sample_schema)
+    assert not is_valid
+    assert len(errors) == 2
+    assert any(e.startswith("At 'name':") for e in errors)
+    assert any("order" in e for e in errors)
+
+@pytest.mark.positive
+def test_validate_against_schema_compiled_valid():
+    pytest.importorskip("fastjsonschema")
+    compiled = helper.compile_fast_validator(sample_schema)
+    is_valid, errors = helper.validate_against_schema(valid_schema_data, sample_schema, compiled)
+    assert is_valid
+    assert errors == []
+
+@pytest.mark.negative
+def test_validate_against_schema_compiled_invalid():
+    pytest.importorskip("fastjsonschema")
+    compiled = helper.compile_fast_validator(sample_schema)
+    is_valid, errors = helper.validate_against_schema(invalid_schema_data, sample_schema, compiled)
+    assert not is_valid
+    assert len(errors) == 1
+    assert "order" in errors[0]
+
+@pytest.mark.negative
+def test_validate_against_schema_ref_schema_invalid():
+    is_valid, errors = helper.validate_against_schema([valid_schema_data, invalid_schema_data], ref_schema)
+    assert not is_valid
+    assert errors == ["At '1': 'order' is a required property"]
+
+@pytest.mark.positive
+def test_validate_against_schema_leaves_data_unchanged():
+    pytest.importorskip("fastjsonschema")
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "retries": {"type": "integer", "default": 3}},
+    }
+    data = {"name": "test1"}
+    is_valid, errors = helper.validate_against_schema(data, schema)
+    assert is_valid
+    assert data == {"name": "test1"}
+
+# ---- load_generated_validator ----
+@pytest.mark.positive
+def test_load_generated_validator_uses_emitted_module(tmp_path, monkeypatch):
+    pytest.importorskip("fastjsonschema")
+    module_name = helper.GENERATED_VALIDATOR_MODULE
+    helper.emit_fast_validator(sample_schema, tmp_path / f"{module_name}.py")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    try:
+        generated = helper.load_generated_validator(sample_schema)
+        assert generated.__module__ == module_name
+        assert helper.compile_fast_validator(sample_schema).__module__ != module_name
+        assert helper.load_generated_validator({"type": "string"}) is None
+    finally:
+        sys.modules.pop(module_name, None)
+
+# ---- validate_many ----
+@pytest.mark.negative
+def test_validate_many_mixed_instances():
+    results = helper.validate_many([valid_schema_data, invalid_schema_data], sample_schema)
+    assert results[0] == (True, [])
+    assert results[1][0] is False
+    assert "order" in results[1][1][0]
+
+# ---- get_validator ----
+@pytest.mark.positive
+def test_get_validator_reuses_equal_schemas():
+    first = helper.get_validator(sample_schema)
+    second = helper.get_validator(json.loads(json.dumps(sample_schema)))
+    assert first is second
+
+@pytest.mark.positive
+def test_get_validator_accepts_cached_schema():
+    cached = helper.CachedSchema(sample_schema)
+    assert helper.get_validator(cached) is helper.get_validator(sample_schema)
+    is_valid, errors = helper.validate_against_schema(valid_schema_data, cached)
+    assert is_valid
+    assert errors == []
+
+@pytest.mark.positive
+def test_get_validator_without_fast_compile():
+    validator, compiled = helper.get_validator(sample_schema, compile_fast=False)
+    assert compiled is None
+    assert validator is helper.get_validator(sample_schema)[0]
+
+@pytest.mark.positive
+def test_get_validator_reuses_ref_schemas():
+    assert helper.get_validator(ref_schema) is helper.get_validator(dict(ref_schema))
+
 # ---- check_unique_orders ----
 @pytest.mark.positive
-def test_check_unique_orders_no_duplicates():
+def test_check_unique_orders_no_duplicates(minimal_config):
     errors = helper.check_unique_orders(minimal_config)
     assert errors == []
 
 @pytest.mark.negative
-def test_check_unique_orders_with_duplicates():
+def test_check_unique_orders_with_duplicates(duplicate_order_config):
     errors = helper.check_unique_orders(duplicate_order_config)
     assert len(errors) == 1
     assert "Duplicate test orders" in errors[0]
 
+@pytest.mark.negative
+def test_check_unique_orders_across_suites():
+    config = {
+        "tests": [{"name": "t1", "order": 1}],
+        "test_suites": [{"name": "empty"}, {"tests": [{"name": "t2", "order": 1}]}],
+    }
+    errors = helper.check_unique_orders(config)
+    assert errors == ["Duplicate test orders: [1]"]
+
 # ---- check_test_dependencies ----
 @pytest.mark.negative
-def test_check_test_dependencies_missing_reference():
+def test_check_test_dependencies_missing_reference(dependency_config):
     errors = helper.check_test_dependencies(dependency_config)
     assert len(errors) == 1
     assert "depends on non-existent" in errors[0]
 
+@pytest.mark.negative
+def test_check_test_dependencies_missing_response_reference():
+    config = {
+        "tests": [{"name": "t1", "order": 1}],
+        "test_suites": [{"tests": [
+            {"name": "t2", "order": 2, "depends_on": ["t1"], "use_response_from": {"test_name": "t3"}},
+        ]}],
+    }
+    errors = helper.check_test_dependencies(config)
+    assert errors == ["Test 't2' references non-existent 't3'"]
+
+# ---- _has_cycle_topo ----
+@pytest.mark.negative
+def test_has_cycle_topo_self_dependency():
+    assert helper._has_cycle_topo({"A": ["A"], "B": ["A"]})
+
+@pytest.mark.positive
+def test_has_cycle_topo_ignores_missing_dependency():
+    assert not helper._has_cycle_topo({"A": ["B", "missing"], "B": []})
+
 # ---- check_circular_dependencies ----
 @pytest.mark.negative
-def test_check_circular_dependencies_detects_cycle():
+def test_check_circular_dependencies_detects_cycle(circular_config):
     errors = helper.check_circular_dependencies(circular_config)
     assert len(errors) == 1
     assert "Circular dependency detected" in errors[0]
 
+@pytest.mark.negative
+def test_check_circular_dependencies_starts_at_first_name():
+    config = {
+        "tests": [
+            {"name": "C", "depends_on": ["A"]},
+            {"name": "B", "depends_on": ["C"]},
+            {"name": "A", "use_response_from": {"test_name": "B"}},
+        ]
+    }
+    errors = helper.check_circular_dependencies(config)
+    assert errors == ["Circular dependency detected: A → B → C → A"]
+
+@pytest.mark.negative
+def test_check_circular_dependencies_reports_real_loop_once():
+    # B and C both lead back to A, and B <-> C is a second loop in the same group
+    config = {
+        "tests": [
+            {"name": "C", "depends_on": ["A", "B"]},
+            {"name": "A", "depends_on": ["B"]},
+            {"name": "B", "depends_on": ["C"]},
+        ]
+    }
+    errors = helper.check_circular_dependencies(config)
+    assert errors == ["Circular dependency detected: A → B → C → A"]
+
+@pytest.mark.negative
+def test_check_circular_dependencies_self_dependency():
+    config = {"tests": [{"name": "A", "depends_on": ["A"]}, {"name": "B", "depends_on": ["A"]}]}
+    errors = helper.check_circular_dependencies(config)
+    assert errors == ["Circular dependency detected: A → A"]
+
+@pytest.mark.negative
+def test_check_circular_dependencies_long_loop():
+    # Deep enough that a recursive search would hit the recursion limit
+    depth = sys.getrecursionlimit() * 2
+    chain = [{"name": f"c{i}", "depends_on": [f"c{(i + 1) % depth}"]} for i in range(depth)]
+    errors = helper.check_circular_dependencies({"tests": chain})
+    names = [f"c{i}" for i in range(depth)] + ["c0"]
+    assert errors == ["Circular dependency detected: " + " → ".join(names)]
+
+@pytest.mark.positive
+def test_check_circular_dependencies_long_chain_and_shared_dependency():
+    depth = sys.getrecursionlimit() * 2
+    chain = [{"name": f"c{i}", "depends_on": [f"c{i + 1}"]} for i in range(depth)]
+    shared = [{"name": f"s{i}", "depends_on": ["c0"]} for i in range(1000)]
+    errors = helper.check_circular_dependencies({"tests": chain + shared})
+    assert errors == []
+
 # ---- check_required_auth_fields ----
 @pytest.mark.positive
-def test_check_required_auth_fields_valid():
+def test_check_required_auth_fields_valid(valid_auth_config):
     errors = helper.check_required_auth_fields(valid_auth_config)
     assert errors == []
 
 @pytest.mark.negative
-@pytest.mark.parametrize("config,key,expected_error", [
-    (invalid_auth_configs["bearer_missing"], "bearer", "Bearer auth missing"),
-    (invalid_auth_configs["basic_missing"], "basic", "Basic auth missing"),
-    (invalid_auth_configs["api_key_missing"], "api_key", "API key auth missing"),
-])
-def test_check_required_auth_fields_missing(config, key, expected_error):
+def test_check_required_auth_fields_missing(invalid_auth_config):
+    config, expected_error = invalid_auth_config
     errors = helper.check_required_auth_fields(config)
     assert len(errors) == 1
     assert expected_error in errors[0]
 
+@pytest.mark.negative
+@pytest.mark.parametrize("auth_type", [["bearer"], {"name": "bearer"}, None], ids=["list", "dict", "none"])
+def test_check_required_auth_fields_ignores_unknown_type(auth_type):
+    errors = helper.check_required_auth_fields({"global_auth": {"type": auth_type}})
+    assert errors == []
+
 # ---- run_custom_validations ----
 @pytest.mark.negative
 def test_run_custom_validations_combined_errors():
@@ -134,3 +356,23 @@ def test_run_custom_validations_combined_errors():
     errors = helper.run_custom_validations(combined_config)
     assert any("Duplicate test orders" in e for e in errors)
     assert any("Circular dependency detected" in e for e in errors)
+
+@pytest.mark.positive
+def test_run_custom_validations_does_not_mutate_config():
+    config = {
+        "tests": [{"name": "t1", "order": 1}],
+        "test_suites": [{"tests": [{"name": "t2", "order": 2}]}],
+    }
+    first = helper.run_custom_validations(config)
+    second = helper.run_custom_validations(config)
+    assert first == second == []
+    assert len(config["tests"]) == 1
+
+@pytest.mark.negative
+def test_run_custom_validations_sees_changed_tests():
+    config = {"tests": [{"name": "t1", "order": 1}, {"name": "t2", "order": 2}]}
+    assert helper.run_custom_validations(config) == []
+    config["tests"][1]["order"] = 1
+    assert helper.check_unique_orders(config) == ["Duplicate test orders: [1]"]
+    config["tests"].append({"name": "t3", "order": 3, "depends_on": ["t4"]})
+    assert helper.check_test_dependencies(config) == ["Test 't3' depends on non-existent 't4'"]